@@ -0,0 +1,757 @@
+#!/usr/bin/env python3
+"""Build, maintain, and benchmark SQLite FTS5 shadow indexes for PFPT search."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import re
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from check_db_status import REPO_ROOT, resolve_database_path
+
+STATE_TABLE = "FtsSyncState"
+DEFAULT_TERMS = ["pain", "lumbar", "shoulder impingement", "knee", "gait", "M54", "971"]
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+
+@dataclass(frozen=True)
+class FtsSource:
+    """A source table and the FTS5 columns derived from it."""
+
+    table: str
+    # FTS column name -> SQL expression over the source row (``{row}`` is new/old/src).
+    columns: Tuple[Tuple[str, str], ...]
+
+    @property
+    def fts_table(self) -> str:
+        return f"{self.table}_fts"
+
+    def column_names(self) -> str:
+        return ", ".join(name for name, _ in self.columns)
+
+    def column_values(self, row: str) -> str:
+        return ", ".join(expr.format(row=row) for _, expr in self.columns)
+
+
+def _concat(*columns: str) -> str:
+    parts = [f"COALESCE({{row}}.\"{column}\", '')" for column in columns]
+    return "TRIM(" + " || ' ' || ".join(parts) + ")"
+
+
+SOURCES: Dict[str, FtsSource] = {
+    "Icd10Codes": FtsSource(
+        table="Icd10Codes",
+        columns=(("code", '{row}."Code"'), ("description", '{row}."Description"')),
+    ),
+    "CptCodes": FtsSource(
+        table="CptCodes",
+        columns=(("code", '{row}."Code"'), ("description", '{row}."Description"')),
+    ),
+    "Notes": FtsSource(
+        table="Notes",
+        columns=(
+            (
+                "subjective",
+                _concat(
+                    "Subjective_ChiefComplaint",
+                    "Subjective_HistoryOfPresentIllness",
+                    "Subjective_PainLocationsCsv",
+                    "Subjective_AggravatingFactors",
+                    "Subjective_EasingFactors",
+                    "Subjective_FunctionalLimitations",
+                    "Subjective_PatientGoalsNarrative",
+                ),
+            ),
+            ("assessment", _concat("Assessment_ClinicalImpression", "Assessment_RehabPotential")),
+            ("plan", _concat("Plan_PlannedInterventionsCsv", "Plan_NextVisitFocus")),
+        ),
+    ),
+}
+
+# Columns scanned by the application-style ``LIKE '%term%'`` baseline.
+LIKE_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "Icd10Codes": ("Code", "Description"),
+    "CptCodes": ("Code", "Description"),
+    "Notes": (
+        "Subjective_ChiefComplaint",
+        "Subjective_HistoryOfPresentIllness",
+        "Subjective_PainLocationsCsv",
+        "Subjective_AggravatingFactors",
+        "Subjective_EasingFactors",
+        "Subjective_FunctionalLimitations",
+        "Subjective_PatientGoalsNarrative",
+        "Assessment_ClinicalImpression",
+        "Assessment_RehabPotential",
+        "Plan_PlannedInterventionsCsv",
+        "Plan_NextVisitFocus",
+    ),
+}
+
+# Minimal DDL used by the benchmark when no PFPT database is available to copy from.
+# Mirrors the columns created by the Initial migration for the indexed tables.
+FALLBACK_DDL: Dict[str, str] = {
+    "Icd10Codes": (
+        'CREATE TABLE "Icd10Codes" ("Id" TEXT NOT NULL PRIMARY KEY, "Code" TEXT NOT NULL, '
+        '"Description" TEXT NOT NULL, "CreatedAt" TEXT NOT NULL, "CreatedBy" TEXT NULL, '
+        '"UpdatedAt" TEXT NULL, "UpdatedBy" TEXT NULL, "IsDeleted" INTEGER NOT NULL)'
+    ),
+    "CptCodes": (
+        'CREATE TABLE "CptCodes" ("Id" TEXT NOT NULL PRIMARY KEY, "Code" TEXT NOT NULL, '
+        '"Description" TEXT NOT NULL, "CreatedAt" TEXT NOT NULL, "CreatedBy" TEXT NULL, '
+        '"UpdatedAt" TEXT NULL, "UpdatedBy" TEXT NULL, "IsDeleted" INTEGER NOT NULL)'
+    ),
+    "Notes": (
+        'CREATE TABLE "Notes" ("Id" TEXT NOT NULL PRIMARY KEY, "PatientId" TEXT NOT NULL, '
+        '"AppointmentId" TEXT NOT NULL, "VisitType" INTEGER NOT NULL, '
+        + ", ".join(f'"{column}" TEXT NULL' for column in LIKE_COLUMNS["Notes"])
+        + ', "IsSigned" INTEGER NOT NULL, "CreatedAt" TEXT NOT NULL, "CreatedBy" TEXT NULL, '
+        '"UpdatedAt" TEXT NULL, "UpdatedBy" TEXT NULL, "IsDeleted" INTEGER NOT NULL)'
+    ),
+}
+
+
+def quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def table_exists(conn: sqlite3.Connection, name: str) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type IN ('table', 'view') AND name = ?", (name,)
+    ).fetchone()
+    return row is not None
+
+
+def trigger_names(source: FtsSource) -> Tuple[str, str, str]:
+    return (f"{source.fts_table}_ai", f"{source.fts_table}_au", f"{source.fts_table}_ad")
+
+
+def ensure_state_table(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {quote(STATE_TABLE)} ("
+        '"Source" TEXT NOT NULL PRIMARY KEY, '
+        '"Mode" TEXT NOT NULL, '
+        '"LastRowId" INTEGER NOT NULL, '
+        '"LastStamp" TEXT NULL, '
+        '"LastStampRowId" INTEGER NOT NULL, '
+        '"SyncedAt" TEXT NOT NULL)'
+    )
+
+
+def create_fts_table(conn: sqlite3.Connection, source: FtsSource) -> None:
+    # The FTS table stores its own copy of the text keyed by the source rowid, so
+    # rows can be removed by rowid alone once the source row is gone.
+    conn.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {quote(source.fts_table)} USING fts5("
+        f"{source.column_names()}, "
+        "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    )
+
+
+def create_triggers(conn: sqlite3.Connection, source: FtsSource) -> None:
+    insert_name, update_name, delete_name = trigger_names(source)
+    fts, table = quote(source.fts_table), quote(source.table)
+    insert_new = (
+        f"INSERT INTO {fts}(rowid, {source.column_names()}) "
+        f"VALUES (new.rowid, {source.column_values('new')});"
+    )
+    conn.execute(
+        f"CREATE TRIGGER IF NOT EXISTS {quote(insert_name)} AFTER INSERT ON {table} "
+        f"BEGIN {insert_new} END"
+    )
+    conn.execute(
+        f"CREATE TRIGGER IF NOT EXISTS {quote(update_name)} AFTER UPDATE ON {table} "
+        f"BEGIN DELETE FROM {fts} WHERE rowid = old.rowid; {insert_new} END"
+    )
+    conn.execute(
+        f"CREATE TRIGGER IF NOT EXISTS {quote(delete_name)} AFTER DELETE ON {table} "
+        f"BEGIN DELETE FROM {fts} WHERE rowid = old.rowid; END"
+    )
+
+
+def drop_triggers(conn: sqlite3.Connection, source: FtsSource) -> None:
+    for name in trigger_names(source):
+        conn.execute(f"DROP TRIGGER IF EXISTS {quote(name)}")
+
+
+STAMP = 'COALESCE({row}."UpdatedAt", {row}."CreatedAt")'
+
+
+@dataclass(frozen=True)
+class Watermark:
+    """Sync position: highest rowid, plus the highest (stamp, rowid) pair seen."""
+
+    last_rowid: int
+    last_stamp: Optional[str]
+    last_stamp_rowid: int
+
+
+def source_watermark(conn: sqlite3.Connection, source: FtsSource) -> Watermark:
+    table, stamp = quote(source.table), STAMP.format(row="src")
+    last_rowid = conn.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {table}").fetchone()[0]
+    row = conn.execute(
+        f"SELECT {stamp}, src.rowid FROM {table} AS src ORDER BY {stamp} DESC, src.rowid DESC LIMIT 1"
+    ).fetchone()
+    if row is None:
+        return Watermark(int(last_rowid), None, 0)
+    return Watermark(int(last_rowid), row[0], int(row[1]))
+
+
+def write_state(conn: sqlite3.Connection, source: FtsSource, mode: str) -> None:
+    watermark = source_watermark(conn, source)
+    conn.execute(
+        f"INSERT OR REPLACE INTO {quote(STATE_TABLE)} "
+        '("Source", "Mode", "LastRowId", "LastStamp", "LastStampRowId", "SyncedAt") '
+        "VALUES (?, ?, ?, ?, ?, strftime('%Y-%m-%d %H:%M:%f', 'now'))",
+        (source.table, mode, watermark.last_rowid, watermark.last_stamp, watermark.last_stamp_rowid),
+    )
+
+
+def read_state(conn: sqlite3.Connection, source: FtsSource) -> Optional[Tuple[str, Watermark]]:
+    if not table_exists(conn, STATE_TABLE):
+        return None
+    row = conn.execute(
+        f'SELECT "Mode", "LastRowId", "LastStamp", "LastStampRowId" FROM {quote(STATE_TABLE)} '
+        'WHERE "Source" = ?',
+        (source.table,),
+    ).fetchone()
+    return (row[0], Watermark(int(row[1]), row[2], int(row[3]))) if row else None
+
+
+def rebuild_index(conn: sqlite3.Connection, source: FtsSource) -> int:
+    fts = quote(source.fts_table)
+    conn.execute(f"DELETE FROM {fts}")
+    cursor = conn.execute(
+        f"INSERT INTO {fts}(rowid, {source.column_names()}) "
+        f"SELECT src.rowid, {source.column_values('src')} FROM {quote(source.table)} AS src"
+    )
+    conn.execute(f"INSERT INTO {fts}({fts}) VALUES ('optimize')")
+    return cursor.rowcount
+
+
+def sync_index(conn: sqlite3.Connection, source: FtsSource) -> Tuple[int, int]:
+    """Apply source changes since the stored watermark; returns (reindexed, removed)."""
+    state = read_state(conn, source)
+    if state is None:
+        raise RuntimeError(f"{source.fts_table} has not been built; run the 'build' command first")
+    mode, watermark = state
+    fts, table = quote(source.fts_table), quote(source.table)
+
+    removed = conn.execute(
+        f"DELETE FROM {fts} WHERE rowid NOT IN (SELECT rowid FROM {table})"
+    ).rowcount
+
+    # New rows are found by rowid; edits (and rowids reused after deleting the
+    # highest row) are found by their UpdatedAt/CreatedAt stamp. SaveChanges gives
+    # every row in one save the same stamp, so rows at the stored stamp are compared
+    # by rowid too and a bulk-seeded table is not re-indexed on every pass.
+    stamp = STAMP.format(row="src")
+    changed = (
+        f"SELECT src.rowid FROM {table} AS src WHERE src.rowid > ? "
+        f"OR {stamp} > COALESCE(?, '') "
+        f"OR ({stamp} = ? AND src.rowid > ?)"
+    )
+    params = (
+        watermark.last_rowid,
+        watermark.last_stamp,
+        watermark.last_stamp,
+        watermark.last_stamp_rowid,
+    )
+    conn.execute(f"DELETE FROM {fts} WHERE rowid IN ({changed})", params)
+    reindexed = conn.execute(
+        f"INSERT INTO {fts}(rowid, {source.column_names()}) "
+        f"SELECT src.rowid, {source.column_values('src')} FROM {table} AS src "
+        f"WHERE src.rowid IN ({changed})",
+        params,
+    ).rowcount
+    write_state(conn, source, mode)
+    return reindexed, removed
+
+
+def build_indexes(conn: sqlite3.Connection, tables: Sequence[str], mode: str) -> Dict[str, int]:
+    ensure_state_table(conn)
+    indexed: Dict[str, int] = {}
+    for name in tables:
+        source = SOURCES[name]
+        create_fts_table(conn, source)
+        drop_triggers(conn, source)
+        if mode == "triggers":
+            create_triggers(conn, source)
+        indexed[name] = rebuild_index(conn, source)
+        write_state(conn, source, mode)
+    return indexed
+
+
+def drop_indexes(conn: sqlite3.Connection, tables: Sequence[str]) -> None:
+    for name in tables:
+        source = SOURCES[name]
+        drop_triggers(conn, source)
+        conn.execute(f"DROP TABLE IF EXISTS {quote(source.fts_table)}")
+        if table_exists(conn, STATE_TABLE):
+            conn.execute(f'DELETE FROM {quote(STATE_TABLE)} WHERE "Source" = ?', (name,))
+    if table_exists(conn, STATE_TABLE):
+        remaining = conn.execute(f"SELECT COUNT(*) FROM {quote(STATE_TABLE)}").fetchone()[0]
+        if not remaining:
+            conn.execute(f"DROP TABLE {quote(STATE_TABLE)}")
+
+
+def match_expression(term: str) -> str:
+    """Turn free text into an FTS5 query: every word must match as a prefix."""
+    words = [word for word in term.replace('"', " ").split() if word]
+    if not words:
+        raise ValueError(f"search term {term!r} contains no words")
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def fts_query(source: FtsSource, limit: int, ranked: bool = True) -> str:
+    sql = (
+        f'SELECT src."Id" FROM {quote(source.fts_table)} AS f '
+        f"JOIN {quote(source.table)} AS src ON src.rowid = f.rowid "
+        f'WHERE {quote(source.fts_table)} MATCH ? AND src."IsDeleted" = 0'
+    )
+    if ranked:
+        sql += " ORDER BY f.rank"
+    return sql + (f" LIMIT {limit}" if limit else "")
+
+
+def like_query(table: str, limit: int) -> str:
+    predicate = " OR ".join(f"{quote(column)} LIKE ?" for column in LIKE_COLUMNS[table])
+    sql = f'SELECT "Id" FROM {quote(table)} WHERE "IsDeleted" = 0 AND ({predicate})'
+    return sql + (f" LIMIT {limit}" if limit else "")
+
+
+def like_params(table: str, term: str) -> Tuple[str, ...]:
+    pattern = f"%{term}%"
+    return tuple(pattern for _ in LIKE_COLUMNS[table])
+
+
+def resolve_tables(requested: Optional[Sequence[str]]) -> List[str]:
+    return list(requested) if requested else list(SOURCES.keys())
+
+
+def resolve_db(args: argparse.Namespace) -> Path:
+    if args.db:
+        # A path typed on the command line is relative to the caller's directory.
+        return Path(args.db).expanduser().resolve()
+    db_path, _ = resolve_database_path(args.context, args.environment)
+    return db_path if db_path.is_absolute() else (REPO_ROOT / db_path)
+
+
+@contextmanager
+def write_transaction(db_path: Path) -> Iterator[sqlite3.Connection]:
+    """Open the database and run the body in one transaction, DDL included.
+
+    The sqlite3 module autocommits DDL issued before the first write, so a failed
+    build could otherwise leave triggers behind that break application inserts.
+    """
+    if not db_path.exists():
+        raise FileNotFoundError(f"Database file not found: {db_path}")
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        conn.execute("PRAGMA busy_timeout = 5000")
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+
+def required_columns(name: str) -> List[str]:
+    columns = ["Id", "CreatedAt", "UpdatedAt", "IsDeleted"]
+    for _, expr in SOURCES[name].columns:
+        columns.extend(re.findall(r'\{row\}\."([^"]+)"', expr))
+    columns.extend(LIKE_COLUMNS[name])
+    return list(dict.fromkeys(columns))
+
+
+def check_sources(conn: sqlite3.Connection, tables: Sequence[str]) -> None:
+    missing = [name for name in tables if not table_exists(conn, name)]
+    if missing:
+        raise RuntimeError(f"Missing source tables: {', '.join(missing)}")
+    for name in tables:
+        present = {row[1] for row in conn.execute(f"PRAGMA table_info({quote(name)})")}
+        absent = [column for column in required_columns(name) if column not in present]
+        if absent:
+            raise RuntimeError(f"{name} is missing column(s): {', '.join(absent)}")
+
+
+# --------------------------------------------------------------------------- benchmark
+
+CODE_WORDS = [
+    "low", "back", "pain", "lumbar", "cervical", "thoracic", "radiculopathy", "sprain", "strain",
+    "shoulder", "impingement", "rotator", "cuff", "tear", "knee", "patellofemoral", "syndrome",
+    "ankle", "instability", "hip", "osteoarthritis", "tendinopathy", "bursitis", "stenosis",
+    "spondylosis", "fracture", "sequela", "unspecified", "left", "right", "bilateral",
+    "therapeutic", "exercise", "neuromuscular", "reeducation", "manual", "therapy", "gait",
+    "training", "evaluation", "moderate", "complexity", "each", "minutes", "initial", "encounter",
+]
+NOTE_WORDS = CODE_WORDS + [
+    "patient", "reports", "difficulty", "stairs", "sitting", "standing", "walking", "lifting",
+    "overhead", "reaching", "improved", "worsened", "morning", "stiffness", "after", "work",
+    "goal", "return", "to", "running", "sleep", "disturbed", "tolerates", "progression", "home",
+    "program", "compliance", "good", "fair", "plan", "continue", "strengthening", "mobility",
+]
+
+
+FILLER_SIZE = 5000
+CLINICAL_SHARE = 0.1
+
+
+def _filler_vocabulary(rng: random.Random) -> List[str]:
+    # Real code descriptions and notes draw on a large vocabulary, so most words
+    # come from a long tail of pseudo-words and clinical terms stay selective.
+    letters = "abcdefghiklmnoprstuvy"
+    return ["".join(rng.choice(letters) for _ in range(rng.randint(4, 10))) for _ in range(FILLER_SIZE)]
+
+
+def _words(
+    rng: random.Random, vocabulary: Sequence[str], filler: Sequence[str], low: int, high: int
+) -> str:
+    return " ".join(
+        rng.choice(vocabulary) if rng.random() < CLINICAL_SHARE else rng.choice(filler)
+        for _ in range(rng.randint(low, high))
+    )
+
+
+ICD10_CHAPTERS = "MSGR"  # musculoskeletal, injury, nervous system, symptoms
+
+
+def _icd10_code(rng: random.Random) -> str:
+    # Letter + 2 digits + "." + 1-2 digits, e.g. M54.5 or S83.24.
+    subcategory = rng.randint(0, 9) if rng.random() < 0.5 else rng.randint(0, 99)
+    return f"{rng.choice(ICD10_CHAPTERS)}{rng.randint(0, 99):02d}.{subcategory}"
+
+
+def _cpt_code(rng: random.Random) -> str:
+    # Five digits, weighted toward the 97xxx physical medicine range.
+    if rng.random() < 0.3:
+        return f"{rng.randint(97010, 97799)}"
+    return f"{rng.randint(10000, 99999)}"
+
+
+def _stamp(rng: random.Random) -> str:
+    return f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} 12:00:00"
+
+
+def copy_schema(target: sqlite3.Connection, schema_db: Optional[Path], tables: Sequence[str]) -> str:
+    ddl: Dict[str, str] = dict(FALLBACK_DDL)
+    origin = "built-in schema"
+    if schema_db is not None and schema_db.exists():
+        with sqlite3.connect(f"file:{schema_db}?mode=ro", uri=True) as source:
+            for name in tables:
+                row = source.execute(
+                    "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+                ).fetchone()
+                if row and row[0]:
+                    ddl[name] = row[0]
+        origin = str(schema_db)
+    for name in tables:
+        target.execute(ddl[name])
+    return origin
+
+
+def populate(conn: sqlite3.Connection, table: str, size: int, rng: random.Random) -> None:
+    filler = _filler_vocabulary(rng)
+    if table == "Notes":
+        columns = LIKE_COLUMNS["Notes"]
+        sql = (
+            'INSERT INTO "Notes" ("Id", "PatientId", "AppointmentId", "VisitType", '
+            + ", ".join(quote(column) for column in columns)
+            + ', "IsSigned", "CreatedAt", "IsDeleted") VALUES (?, ?, ?, 0, '
+            + ", ".join("?" for _ in columns)
+            + ", 0, ?, ?)"
+        )
+        rows = (
+            (
+                f"note-{index:08d}", f"patient-{index % 997:05d}", f"appt-{index:08d}",
+                *(_words(rng, NOTE_WORDS, filler, 4, 30) for _ in columns),
+                _stamp(rng), 1 if rng.random() < 0.02 else 0,
+            )
+            for index in range(size)
+        )
+    else:
+        sql = (
+            f'INSERT INTO {quote(table)} ("Id", "Code", "Description", "CreatedAt", "IsDeleted") '
+            "VALUES (?, ?, ?, ?, ?)"
+        )
+        make_code = _icd10_code if table == "Icd10Codes" else _cpt_code
+        rows = (
+            (
+                f"{table}-{index:08d}",
+                make_code(rng),
+                _words(rng, CODE_WORDS, filler, 3, 12),
+                _stamp(rng),
+                1 if rng.random() < 0.02 else 0,
+            )
+            for index in range(size)
+        )
+    conn.executemany(sql, rows)
+
+
+def time_query(
+    conn: sqlite3.Connection, sql: str, params: Sequence[str], repeat: int
+) -> Tuple[float, int]:
+    hits = len(conn.execute(sql, params).fetchall())  # warm-up and result count
+    samples: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        conn.execute(sql, params).fetchall()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), hits
+
+
+def run_benchmark(args: argparse.Namespace) -> List[Dict[str, object]]:
+    tables = resolve_tables(args.tables)
+    schema_db: Optional[Path] = None
+    if not args.builtin_schema:
+        schema_db = resolve_db(args)
+    results: List[Dict[str, object]] = []
+
+    with tempfile.TemporaryDirectory(prefix="pfpt-fts-") as scratch:
+        for size in args.sizes:
+            db_path = Path(scratch) / f"bench-{size}.db"
+            rng = random.Random(args.seed)
+            with sqlite3.connect(db_path) as conn:
+                origin = copy_schema(conn, schema_db, tables)
+                for table in tables:
+                    populate(conn, table, size, rng)
+                conn.commit()
+                base_bytes = db_path.stat().st_size
+
+                started = time.perf_counter()
+                build_indexes(conn, tables, "watermark")
+                conn.commit()
+                build_ms = (time.perf_counter() - started) * 1000
+                index_bytes = db_path.stat().st_size - base_bytes
+                conn.execute("ANALYZE")
+
+                for table in tables:
+                    source = SOURCES[table]
+                    for term in args.terms:
+                        like_ms, like_hits = time_query(
+                            conn, like_query(table, args.limit), like_params(table, term), args.repeat
+                        )
+                        match = (match_expression(term),)
+                        fts_ms, fts_hits = time_query(
+                            conn, fts_query(source, args.limit), match, args.repeat
+                        )
+                        unranked_ms, _ = time_query(
+                            conn, fts_query(source, args.limit, ranked=False), match, args.repeat
+                        )
+                        results.append(
+                            {
+                                "rows": size,
+                                "table": table,
+                                "term": term,
+                                "like_ms": round(like_ms, 3),
+                                "like_hits": like_hits,
+                                "fts_ms": round(fts_ms, 3),
+                                "fts_hits": fts_hits,
+                                "fts_unranked_ms": round(unranked_ms, 3),
+                                "speedup": round(like_ms / fts_ms, 1) if fts_ms else None,
+                                "build_ms": round(build_ms, 1),
+                                "index_bytes": index_bytes,
+                                "schema": origin,
+                            }
+                        )
+    return results
+
+
+def print_benchmark(results: Sequence[Dict[str, object]], limit: int) -> None:
+    if not results:
+        print("No benchmark results")
+        return
+    print(f"Schema source: {results[0]['schema']}")
+    print(f"Result limit: {limit or 'none'} | timings are medians in milliseconds")
+    print("fts ms orders by BM25 rank (as 'search' does); unranked ms skips ORDER BY; speedup uses ranked")
+    header = (
+        f"{'rows':>8}  {'table':<11} {'term':<22} {'like ms':>9} {'hits':>7} "
+        f"{'fts ms':>9} {'hits':>7} {'unranked ms':>12} {'speedup':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    for row in results:
+        speedup = f"{row['speedup']}x" if row["speedup"] is not None else "n/a"
+        print(
+            f"{row['rows']:>8}  {row['table']:<11} {str(row['term'])[:22]:<22} "
+            f"{row['like_ms']:>9.3f} {row['like_hits']:>7} {row['fts_ms']:>9.3f} {row['fts_hits']:>7} "
+            f"{row['fts_unranked_ms']:>12.3f} {speedup:>8}"
+        )
+    print("Index build (all tables):")
+    seen = set()
+    for row in results:
+        if row["rows"] in seen:
+            continue
+        seen.add(row["rows"])
+        print(f"  - {row['rows']} rows: {row['build_ms']} ms, ~{row['index_bytes'] / 1024:.0f} KiB")
+    print("Note: LIKE matches substrings while FTS matches word prefixes, so hit counts can differ.")
+
+
+# --------------------------------------------------------------------------- commands
+
+def command_build(args: argparse.Namespace, db_path: Path) -> int:
+    tables = resolve_tables(args.tables)
+    with write_transaction(db_path) as conn:
+        check_sources(conn, tables)
+        indexed = build_indexes(conn, tables, args.mode)
+    print(f"Built FTS5 indexes ({args.mode} mode):")
+    for name, count in indexed.items():
+        print(f"  - {SOURCES[name].fts_table}: {count} rows")
+    if args.mode == "watermark":
+        print("Run the 'sync' command after data changes to refresh the indexes.")
+    return 0
+
+
+def command_sync(args: argparse.Namespace, db_path: Path) -> int:
+    tables = resolve_tables(args.tables)
+    with write_transaction(db_path) as conn:
+        check_sources(conn, tables)
+        for name in tables:
+            reindexed, removed = sync_index(conn, SOURCES[name])
+            print(f"  - {SOURCES[name].fts_table}: {reindexed} reindexed, {removed} removed")
+    return 0
+
+
+def command_drop(args: argparse.Namespace, db_path: Path) -> int:
+    tables = resolve_tables(args.tables)
+    with write_transaction(db_path) as conn:
+        drop_indexes(conn, tables)
+    print(f"Dropped FTS5 indexes for: {', '.join(tables)}")
+    return 0
+
+
+def command_search(args: argparse.Namespace, db_path: Path) -> int:
+    source = SOURCES[args.table]
+    with sqlite3.connect(f"file:{db_path}?mode=ro", uri=True) as conn:
+        if not table_exists(conn, source.fts_table):
+            print(f"{source.fts_table} does not exist; run the 'build' command first", file=sys.stderr)
+            return 1
+        started = time.perf_counter()
+        ids = [row[0] for row in conn.execute(fts_query(source, args.limit), (match_expression(args.term),))]
+        elapsed = (time.perf_counter() - started) * 1000
+    print(f"{len(ids)} match(es) in {elapsed:.3f} ms")
+    for identifier in ids:
+        print(f"  - {identifier}")
+    return 0
+
+
+def command_benchmark(args: argparse.Namespace) -> int:
+    results = run_benchmark(args)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_benchmark(results, args.limit)
+    return 0
+
+
+def parse_positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value}") from exc
+    if number <= 0:
+        raise argparse.ArgumentTypeError("value must be a positive integer")
+    return number
+
+
+def parse_term(value: str) -> str:
+    try:
+        match_expression(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+    return value
+
+
+def parse_sizes(value: str) -> List[int]:
+    try:
+        sizes = [int(part) for part in value.split(",") if part.strip()]
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid size list: {value}") from exc
+    if not sizes or any(size <= 0 for size in sizes):
+        raise argparse.ArgumentTypeError("sizes must be positive integers")
+    return sizes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Manage and benchmark FTS5 search indexes for the PFPT SQLite database")
+    parser.add_argument("--db", help="Path to the SQLite database (defaults to the path resolved like check_db_status.py)")
+    parser.add_argument(
+        "--context",
+        choices=["api", "seeder"],
+        default="api",
+        help="Which application context to emulate when resolving the database path",
+    )
+    parser.add_argument(
+        "--environment",
+        default=os.getenv("ASPNETCORE_ENVIRONMENT", "Development"),
+        help="Environment name used when loading appsettings.{Environment}.json",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    table_help = "Source tables to operate on (default: all of %(choices)s)"
+
+    build = subparsers.add_parser("build", help="Create (or recreate) the FTS5 shadow indexes and populate them")
+    build.add_argument("--tables", nargs="+", choices=list(SOURCES), help=table_help)
+    build.add_argument(
+        "--mode",
+        choices=["triggers", "watermark"],
+        default="triggers",
+        help="Keep indexes current with AFTER INSERT/UPDATE/DELETE triggers, or via explicit 'sync' passes",
+    )
+
+    sync = subparsers.add_parser("sync", help="Apply changes since the last build/sync using the rowid watermark")
+    sync.add_argument("--tables", nargs="+", choices=list(SOURCES), help=table_help)
+
+    drop = subparsers.add_parser("drop", help="Remove FTS5 tables, triggers, and sync state")
+    drop.add_argument("--tables", nargs="+", choices=list(SOURCES), help=table_help)
+
+    search = subparsers.add_parser("search", help="Run an FTS query against a built index")
+    search.add_argument("table", choices=list(SOURCES))
+    search.add_argument("term", type=parse_term)
+    search.add_argument("--limit", type=int, default=25, help="Maximum results (0 for no limit)")
+
+    bench = subparsers.add_parser("benchmark", help="Compare FTS5 MATCH against LIKE '%%term%%' on synthetic data")
+    bench.add_argument("--tables", nargs="+", choices=list(SOURCES), help=table_help)
+    bench.add_argument("--sizes", type=parse_sizes, default=DEFAULT_SIZES, help="Comma-separated row counts per table (default: 1000,10000,100000)")
+    bench.add_argument("--terms", nargs="+", type=parse_term, default=DEFAULT_TERMS, metavar="TERM", help="Search terms to time")
+    bench.add_argument("--repeat", type=parse_positive_int, default=5, help="Timed runs per query; the median is reported")
+    bench.add_argument("--limit", type=int, default=0, help="Apply LIMIT to both queries (0 for no limit)")
+    bench.add_argument("--seed", type=int, default=42, help="Random seed for synthetic data")
+    bench.add_argument("--builtin-schema", action="store_true", help="Do not copy table DDL from the resolved database")
+    bench.add_argument("--json", action="store_true", help="Emit results as JSON")
+
+    args = parser.parse_args()
+
+    handlers = {
+        "build": command_build,
+        "sync": command_sync,
+        "drop": command_drop,
+        "search": command_search,
+    }
+    try:
+        if args.command == "benchmark":
+            return command_benchmark(args)
+        db_path = resolve_db(args)
+        print(f"Database path: {db_path}")
+        return handlers[args.command](args, db_path)
+    except (FileNotFoundError, RuntimeError, ValueError, sqlite3.Error) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())